@@ -11,22 +11,22 @@ Python coordinator for Scavenger Mine:
 
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
 import socket
 import threading
 import time
-import random
 import sys
 import csv
 import os
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Optional, Dict, List
+import functools
+from typing import Optional, Dict, List, Deque
+from collections import deque
 from datetime import datetime, timezone
 import argparse
 import threading
 import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 
@@ -39,10 +39,13 @@ DAEMON_HOST = "127.0.0.1"
 DAEMON_PORT = 4002
 SOCKET_TIMEOUT = 5.0  # seconds
 NONCE_BATCH = 1024  # number of nonces a worker loops before refreshing challenge check
+SEARCH_TIMEOUT = 120.0  # seconds the daemon may spend on one SEARCH of NONCE_BATCH nonces
 # -----------------------------------
 
 # thread-safe counters
 class Stats:
+    __slots__ = ('lock', 'hashes', 'solutions', 'starts', 'last_report')
+
     def __init__(self):
         self.lock = threading.Lock()
         self.hashes = 0
@@ -51,6 +54,7 @@ class Stats:
         self.last_report = time.time()
 
     def add_hashes(self, n):
+        # takes the shared lock: call once per batch (workers report per SEARCH), never per nonce
         with self.lock:
             self.hashes += n
 
@@ -77,49 +81,74 @@ challenge_fetched = threading.Event()
 
 # Error logging
 class ErrorLogger:
-    def __init__(self):
-        self.errors: List[Dict] = []
+    """Append each error to <name>.<timestamp>.txt as it happens (crash-safe),
+    keeping only the most recent ones in memory for the exit report."""
+    __slots__ = ('name', 'errors', 'lock', 'count', '_fh')
+
+    def __init__(self, name: str, keep: int = 1000):
+        self.name = name
+        self.errors: Deque[Dict] = deque(maxlen=keep)
         self.lock = threading.Lock()
+        self.count = 0
+        self._fh = None
     
     def log_error(self, address: str, challenge_id: str, nonce: str, error: str):
+        entry = {
+            'timestamp': now_iso(),
+            'address': address,
+            'challenge_id': challenge_id,
+            'nonce': nonce,
+            'error': error
+        }
         with self.lock:
-            self.errors.append({
-                'timestamp': now_iso(),
-                'address': address,
-                'challenge_id': challenge_id,
-                'nonce': nonce,
-                'error': error
-            })
+            self.errors.append(entry)
+            self.count += 1
+            try:
+                if self._fh is None:
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    self._fh = open(f"{self.name}.{timestamp}.txt", 'a', buffering=1)
+                self._fh.write(f"{entry['timestamp']} - {entry['address']}/{entry['challenge_id']}/{entry['nonce']} - {entry['error']}\n")
+            except Exception as e:
+                print(f"Failed to write error log: {e}")
     
-    def save_errors_to_file(self, address: str):
-        if not self.errors:
-            return
-            
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{address}.{timestamp}.txt"
-        
-        try:
-            with open(filename, 'w') as f:
-                for error in self.errors:
-                    f.write(f"{error['timestamp']} - {error['address']}/{error['challenge_id']}/{error['nonce']} - {error['error']}\n")
-            print(f"Saved {len(self.errors)} error logs to {filename}")
-        except Exception as e:
-            print(f"Failed to save error log: {e}")
-
-error_logger = ErrorLogger()
+    def close(self):
+        with self.lock:
+            if self._fh is None:
+                return
+            self._fh.close()
+            print(f"Saved {self.count} error logs to {self._fh.name}")
+            if self.errors:
+                last = self.errors[-1]
+                print(f"Last error: {last['timestamp']} - {last['challenge_id']}/{last['nonce']} - {last['error']}")
+            self._fh = None
+
+error_logger = ErrorLogger("MULTIADDR")
+
+# shared HTTP session so submit retries reuse a keep-alive connection
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+_SESSION.headers.update({"Connection": "keep-alive"})
 
 # ----------------- utilities -----------------
-def hex64_nonce():
-    """Return 64-bit hex nonce (16 hex chars)"""
-    return "{:016x}".format(random.getrandbits(64))
+MASK64 = 0xFFFFFFFFFFFFFFFF
 
 def now_iso():
     return datetime.now(timezone.utc).isoformat()
 
+@functools.lru_cache(maxsize=1024)
+def parse_expiry(s: str) -> Optional[float]:
+    """Epoch seconds for an ISO timestamp like "2025-10-30T23:59:59Z", or None if unparsable."""
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
 def post_solution(base_url: str, address: str, challenge_id: str, nonce: str):
     url = f"{base_url.rstrip('/')}/solution/{address}/{challenge_id}/{nonce}"
     try:
-        r = requests.post(url, json={}, timeout=10)
+        r = _SESSION.post(url, json={}, timeout=10)
         try:
             return r.status_code, r.json()
         except:
@@ -158,22 +187,14 @@ def build_preimage(nonce_hex: str, address: str, challenge: dict) -> str:
     ]
     return "".join(parts)
 
-def hash_meets_difficulty(hash_hex: str, difficulty_hex: str) -> bool:
+def fast_check(hash_head_u32: int, inv_mask: int) -> bool:
     """
     Reproduce the left-4-bytes zero-bit test used earlier:
-    Convert left 4 bytes of hash to uint32 = left4
-    Convert difficulty_hex to uint32 = mask
+    hash_head_u32 = left 4 bytes of hash as uint32
+    inv_mask = (~difficulty_mask & 0xFFFFFFFF), precomputed once per challenge
     Requirement used: bits that are zero in mask MUST be zero in left4
-    Equivalent: (left4 & (~mask & 0xFFFFFFFF)) == 0
     """
-    if not hash_hex or len(hash_hex) < 8:
-        return False
-    try:
-        left4 = int(hash_hex[0:8], 16)
-        mask = int(difficulty_hex, 16)
-    except Exception:
-        return False
-    return (left4 & (~mask & 0xFFFFFFFF)) == 0
+    return (hash_head_u32 & inv_mask) == 0
 
 def read_challenges_from_csv(csv_file: str):
     """
@@ -189,26 +210,26 @@ def read_challenges_from_csv(csv_file: str):
     """
     challenges = []
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
+        with open(csv_file, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
             reader = csv.reader(f)
             header = next(reader)  # Read header row
             
             for row in reader:
-                if len(row) < 5:  # At least 4 columns required
+                if len(row) < 5:  # All 5 columns required
                     continue
                     
                 # Map CSV columns to challenge dict
-                challenge = {
-                    "challenge_id": row[0].strip() if len(row) > 0 else "",
-                    "difficulty": row[1].strip() if len(row) > 1 else "",
-                    "no_pre_mine": row[2].strip() if len(row) > 2 else "",
-                    "no_pre_mine_hour": row[3].strip() if len(row) > 3 else "",
-                    "latest_submission": row[4].strip() if len(row) > 4 else "2099-12-31T23:59:59.000Z"
-                }
+                cid, diff, npm, npmh, ls = row[0].strip(), row[1].strip(), row[2].strip(), row[3].strip(), row[4].strip()
                 
                 # Validate required fields
-                if challenge["challenge_id"] and challenge["difficulty"] and challenge["no_pre_mine"]:
-                    challenges.append(challenge)
+                if cid and diff and npm:
+                    challenges.append({
+                        "challenge_id": cid,
+                        "difficulty": diff,
+                        "no_pre_mine": npm,
+                        "no_pre_mine_hour": npmh,
+                        "latest_submission": ls or "2099-12-31T23:59:59.000Z"
+                    })
                     
         print(f"Loaded {len(challenges)} challenges from {csv_file}")
     except Exception as e:
@@ -237,6 +258,14 @@ def safe_get_challenge(base_url: str):
 
 # ----------------- worker -----------------
 class Worker:
+    """Mining loop with its own persistent daemon socket.
+
+    A Worker is single-thread-only: its socket is used without locking, so
+    each instance must be driven by exactly one thread.
+    """
+    __slots__ = ('id', 'host', 'port', 'base_url', 'address', 'challenge_getter', 'submit_on_find',
+                 'sock', '_nonce')
+
     def __init__(self, id:int, host:str, port:int, base_url:str, address:str, challenge_getter, submit_on_find:bool):
         self.id = id
         self.host = host
@@ -246,7 +275,9 @@ class Worker:
         self.challenge_getter = challenge_getter
         self.submit_on_find = submit_on_find
         self.sock = None
-        self.sock_lock = threading.Lock()
+        # per-worker nonce counter: worker id in the top byte, random low 56 bits,
+        # so workers walk disjoint ranges of the nonce space
+        self._nonce = (int.from_bytes(os.urandom(7), "big") | (self.id << 56)) & MASK64
 
     def _ensure_socket(self):
         # maintain a persistent socket per worker to daemon
@@ -255,6 +286,33 @@ class Worker:
         try:
             s = socket.create_connection((self.host, self.port), timeout=SOCKET_TIMEOUT)
             s.settimeout(SOCKET_TIMEOUT)
+            # small request/reply lines: no Nagle / delayed-ACK stalls, room for batched replies
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+                try:
+                    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+                except OSError:
+                    pass
+            # a daemon built before SEARCH hashes "PING" like any preimage instead of answering PONG
+            s.sendall(b"PING\n")
+            buf = b""
+            while b"\n" not in buf:
+                b = s.recv(4096)
+                if not b:
+                    raise ConnectionError("daemon closed")
+                buf += b
+            reply = buf.split(b"\n", 1)[0].decode("utf-8", "replace").strip()
+            if reply != "PONG":
+                s.close()
+                print(f"[worker {self.id}] daemon at {self.host}:{self.port} answered PING with {reply[:80]!r}: "
+                      f"it has no SEARCH support, rebuild ashdaemon from src/main.rs")
+                stop_event.set()
+                job = self.challenge_getter()
+                if job is not None:
+                    job["_done"].set()  # wake the orchestrator so the run ends now
+                return False
             self.sock = s
             return True
         except Exception as e:
@@ -262,28 +320,37 @@ class Worker:
             self.sock = None
             return False
 
-    def _send_pre_and_recv_hash(self, preimage: str) -> Optional[str]:
+    def _send_batch_and_recv(self, lines: List[bytes], timeout: float = SOCKET_TIMEOUT) -> Optional[List[str]]:
+        """Pipeline a batch of request lines to the daemon and read back one reply per line.
+
+        All lines are written with a single sendall, then responses are read
+        until N newlines arrived, so the batch costs one round-trip instead of N.
+        """
+        if not lines:
+            return []
+        return self._send_and_recv(b"\n".join(lines) + b"\n", len(lines), timeout)
+
+    def _send_and_recv(self, data, n: int, timeout: float = SOCKET_TIMEOUT) -> Optional[List[str]]:
+        """Send a ready, newline-terminated request buffer and read back n reply lines."""
         # ensure socket
         if not self._ensure_socket():
             # small backoff
             time.sleep(0.1)
             return None
         try:
-            # send line with newline
-            data = preimage + "\n"
-            with self.sock_lock:
-                self.sock.sendall(data.encode("utf-8"))
-                # read until newline
-                buf = bytearray()
-                while True:
-                    b = self.sock.recv(4096)
-                    if not b:
-                        raise ConnectionError("daemon closed")
-                    buf.extend(b)
-                    if b.find(b"\n") != -1:
-                        break
-                line = buf.split(b"\n",1)[0].decode("utf-8").strip()
-            return line
+            self.sock.settimeout(timeout)
+            self.sock.sendall(data)
+            # read until we have one line per preimage; only new chunks are scanned
+            buf = bytearray()
+            newlines = 0
+            while newlines < n:
+                b = self.sock.recv(65536)
+                if not b:
+                    raise ConnectionError("daemon closed")
+                buf += b
+                newlines += b.count(b"\n")
+            lines = buf.split(b"\n", n)
+            return [line.decode("utf-8").strip() for line in lines[:n]]
         except Exception:
             # drop socket, attempt reconnect next time
             try:
@@ -382,100 +449,125 @@ class Worker:
                 challenge_fetched.set()
 
     def run(self):
-        # main loop: keep trying with current challenge until stop_event or new challenge
+        # main loop: keep trying with current challenge until stop_event; the
+        # orchestrator swaps challenges underneath, the socket stays open
         print(f"[worker {self.id}] started")
         
         # Fetch and save challenge when worker starts
         self._fetch_and_save_challenge()
         
+        current = None
         while not stop_event.is_set():
             challenge = self.challenge_getter()
             if challenge is None:
                 time.sleep(0.5)
                 continue
+            if challenge["_done"].is_set():
+                # solved; wait for the orchestrator to hand out the next challenge
+                time.sleep(0.1)
+                continue
             # check active window
             if "latest_submission" not in challenge:
                 # maybe not active
                 time.sleep(0.5)
                 continue
 
-            difficulty = challenge["difficulty"]
-            challenge_id = challenge["challenge_id"]
-            latest_submission = challenge["latest_submission"]
-            # parse latest_submission time to epoch if needed to stop timely:
-            try:
-                # accept ISO like "2025-10-30T23:59:59Z"
-                # Python's fromisoformat does not parse ending Z, handle:
-                ls = latest_submission
-                if ls.endswith("Z"):
-                    ls = ls[:-1] + "+00:00"
-                latest_ts = datetime.fromisoformat(ls).timestamp()
-            except Exception:
-                latest_ts = None
-
-            # inner loop: try many nonces
-            tries = 0
-            for _ in range(NONCE_BATCH):
-                if stop_event.is_set():
-                    break
-                # quick time check
-                if latest_ts and time.time() > latest_ts:
-                    # expired
-                    break
-                nonce = hex64_nonce()
-                pre = build_preimage(nonce, self.address, challenge)
-                # Prefix the preimage with the challenge's no_pre_mine so the
+            if challenge is not current:
+                # everything but the nonce is constant for a challenge: build it once
+                current = challenge
+                difficulty = challenge["difficulty"]
+                challenge_id = challenge["challenge_id"]
+                address = challenge.get("_address", self.address)
+                latest_ts = challenge.get("_latest_ts")
+                try:
+                    inv_mask = (~int(difficulty, 16)) & 0xFFFFFFFF
+                except ValueError:
+                    print(f"[worker {self.id}] invalid difficulty {difficulty!r} for challenge {challenge_id}")
+                    inv_mask = None
+                # Prefix requests with the challenge's no_pre_mine so the
                 # daemon can initialize/reuse the ROM without separate --rom.
                 rom = challenge.get("no_pre_mine", "")
-                pre_with_rom = f"{rom}|{pre}"
-                hash_hex = self._send_pre_and_recv_hash(pre_with_rom)
-                if hash_hex is None:
-                    # no response from daemon, small backoff
-                    time.sleep(0.01)
-                    continue
-                tries += 1
-                stats.add_hashes(1)
-                # check difficulty
-                if hash_meets_difficulty(hash_hex, difficulty):
-                    print(f"[worker {self.id}] FOUND nonce={nonce} hash={hash_hex} challenge={challenge_id}")
-                    stats.inc_solutions()
-                    if self.submit_on_find:
-                        attempts = 0
-                        sc = None  # ensure sc exists
-
-                        while attempts < 3:
-                            try:
-                                sc, resp = post_solution(self.base_url, self.address, challenge_id, nonce)
-                                print(f"[worker {self.id}] submit returned: {sc} {resp}")
-
-                                if sc == 201:
-                                    stop_event.set()
-                                    break
-
-                                attempts += 1
-                                print(f"[worker {self.id}] submit retry {attempts}/3...")
-                                time.sleep(1)
-
-                            except Exception as e:
-                                attempts += 1
-                                print(f"[worker {self.id}] ERROR submit attempt {attempts}/3 — {e}")
-                                time.sleep(1)
-
-                        # Nếu sau 3 lần vẫn fail → dừng để tránh mất valid nonce
-                        if sc != 201:
-                            print(f"[worker {self.id}] ❌ FAILED TO SUBMIT VALID NONCE — STOPPING TO AVOID LOSING IT")
-                            stop_event.set()
-
-                    # optionally continue searching (do not stop others) or wait for orchestration to refresh challenge
-                    time.sleep(0.5)
-                    break  # re-fetch challenge since server may rotate difficulty
-
-            # small yield
-            time.sleep(0.001)
+                suffix = build_preimage("", address, challenge).encode("utf-8")
+                rom_prefix = f"{rom}|".encode("utf-8")
+                # SEARCH request template; only the 16-char start nonce is patched per batch
+                search_head = f"SEARCH|{rom}|{difficulty}|".encode("utf-8")
+                search_buf = bytearray(search_head + b"0" * 16 + f"|{NONCE_BATCH}|".encode("utf-8") + suffix + b"\n")
+                nonce_slot = memoryview(search_buf)[len(search_head):len(search_head) + 16]
+                warned = False
+
+            if inv_mask is None:
+                time.sleep(0.5)
+                continue
+            # inner loop: the daemon walks NONCE_BATCH nonces and only reports a hit
+            if latest_ts and time.time() > latest_ts:
+                # expired
+                time.sleep(0.001)
+                continue
+            start = self._nonce
+            self._nonce = (self._nonce + NONCE_BATCH) & MASK64
+            nonce_slot[:] = b"%016x" % start
+            reply = self._send_and_recv(search_buf, 1, timeout=SEARCH_TIMEOUT)
+            if not reply or not reply[0].startswith(("FOUND|", "MISS")):
+                if reply and not warned:
+                    # e.g. "err": the daemon rejected the request; say so once per challenge
+                    print(f"[worker {self.id}] unexpected SEARCH reply {reply[0][:80]!r} for challenge {challenge_id}")
+                    warned = True
+                # no usable response from daemon, small backoff
+                time.sleep(0.01)
+                continue
+            if reply[0] == "MISS":
+                stats.add_hashes(NONCE_BATCH)
+                time.sleep(0.001)
+                continue
+
+            _, nonce, hash_hex = reply[0].split("|", 2)
+            stats.add_hashes(((int(nonce, 16) - start) & MASK64) + 1)
+            # verify the daemon's hit with a plain hash of the same preimage before submitting
+            check = self._send_batch_and_recv([rom_prefix + nonce.encode("utf-8") + suffix])
+            if not check or check[0] != hash_hex or not fast_check(int(hash_hex[:8], 16), inv_mask):
+                print(f"[worker {self.id}] daemon hit nonce={nonce} failed verification, skipping")
+                continue
+            if challenge["_done"].is_set() or self.challenge_getter() is not challenge:
+                # another worker solved this job, or the orchestrator moved on, while we searched
+                continue
+
+            print(f"[worker {self.id}] FOUND nonce={nonce} hash={hash_hex} challenge={challenge_id}")
+            stats.inc_solutions()
+            if self.submit_on_find:
+                attempts = 0
+                sc = None  # ensure sc exists
+
+                while attempts < 3:
+                    try:
+                        sc, resp = post_solution(self.base_url, address, challenge_id, nonce)
+                        print(f"[worker {self.id}] submit returned: {sc} {resp}")
+
+                        if sc == 201:
+                            break
+
+                        attempts += 1
+                        print(f"[worker {self.id}] submit retry {attempts}/3...")
+                        time.sleep(1)
+
+                    except Exception as e:
+                        attempts += 1
+                        print(f"[worker {self.id}] ERROR submit attempt {attempts}/3 — {e}")
+                        time.sleep(1)
+
+                # Nếu sau 3 lần vẫn fail → dừng để tránh mất valid nonce
+                if sc != 201:
+                    print(f"[worker {self.id}] ❌ FAILED TO SUBMIT VALID NONCE — STOPPING TO AVOID LOSING IT")
+
+                # either way this job is finished; its own event can't end the next one
+                challenge["_done"].set()
+            # no pause here: the loop top parks on a finished job / exits on stop_event right away
         print(f"[worker {self.id}] stopping")
 
 # --------------- orchestrator ---------------
 class Orchestrator:
+    __slots__ = ('base_url', 'address', 'daemon_host', 'daemon_port', 'workers_count', 'submit_on_find',
+                 'current_challenge', 'challenge_lock', 'workers', 'threads')
+
     def __init__(self, base_url, address, daemon_host, daemon_port, workers, submit_on_find):
         self.base_url = base_url
         self.address = address
@@ -486,7 +578,7 @@ class Orchestrator:
         self.current_challenge = None
         self.challenge_lock = threading.Lock()
         self.workers = []
-        self.executor = None
+        self.threads = []
 
     def challenge_getter(self):
         with self.challenge_lock:
@@ -499,24 +591,36 @@ class Orchestrator:
             print(f"[debug] Setting challenge: {challenge}")
             if isinstance(challenge, dict):
                 print(f"[debug] Challenge keys: {list(challenge.keys())}")
+                # parse latest_submission to epoch once here so workers don't each redo it;
+                # _done is set once this job (challenge + address) is solved, separate from
+                # the global stop_event and from every other job
+                latest_ts = parse_expiry(challenge.get("latest_submission") or "")
+                challenge = dict(challenge, _latest_ts=latest_ts, _address=self.address,
+                                 _done=threading.Event())
             self.current_challenge = challenge
 
     def start_workers(self):
-        self.executor = ThreadPoolExecutor(max_workers=self.workers_count)
         for i in range(self.workers_count):
-            w = Worker(i, self.daemon_host, self.daemon_port, self.base_url, self.address, self.challenge_getter, self.submit_on_find)
-            # run worker.run in thread
-            self.executor.submit(w.run)
+            w = Worker(i, self.daemon_host, self.daemon_port, self.base_url, self.address, self.challenge_getter,
+                       self.submit_on_find)
             self.workers.append(w)
+        # workers never return until stop_event, so plain threads are enough
+        self.threads = [threading.Thread(target=w.run, daemon=True) for w in self.workers]
+        for t in self.threads:
+            t.start()
         print(f"[orchestrator] started {self.workers_count} workers")
 
     def stop_workers(self):
         stop_event.set()
-        if self.executor:
-            self.executor.shutdown(wait=True)
-
-    def run(self, stats_interval=5.0):
-        """Run orchestrator with current challenge"""
+        for t in self.threads:
+            t.join(timeout=2)
+
+    def run_until_stop(self, challenge, address=None, stats_interval=5.0):
+        """Point the running workers at challenge (for address, if given) and
+        print stats until one of them submits a solution for it."""
+        if address is not None:
+            self.address = address
+        self.set_challenge(challenge)
         timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
         
         ch = self.current_challenge
@@ -534,34 +638,31 @@ class Orchestrator:
         expires = ch.get('latest_submission', 'N/A')
         
         print(f"[{timestamp}] [orchestrator] Starting with challenge: id={challenge_id} "
-              f"difficulty={difficulty} expires={expires}")
+              f"difficulty={difficulty} expires={expires} address={self.address}")
         
-        # Start workers
-        self.start_workers()
-        last_stats = time.time()
+        next_stats = time.time() + stats_interval
+        done = ch["_done"]
         
         try:
-            while not stop_event.is_set():
-                # Just keep printing stats until interrupted
+            # Just keep printing stats until solved; wait() returns True as soon as the job's _done is set
+            while not done.wait(timeout=max(0.0, next_stats - time.time())):
+                if stop_event.is_set():
+                    break
                 current_time = time.time()
-                if current_time - last_stats >= stats_interval:
-                    h, s = stats.snapshot()
-                    elapsed = max(0.001, current_time - stats.last_report)
-                    hps = h / elapsed if elapsed > 0 else 0
-                    print(f"[stats] hashes={h} ({hps:.1f} H/s) solutions={s}")
-                    stats.last_report = current_time
-                    last_stats = current_time
-                
-                # Small sleep to prevent busy waiting
-                time.sleep(0.1)
+                h, s = stats.snapshot()
+                elapsed = max(0.001, current_time - stats.last_report)
+                hps = h / elapsed if elapsed > 0 else 0
+                print(f"[stats] hashes={h} ({hps:.1f} H/s) solutions={s}")
+                stats.last_report = current_time
+                next_stats = current_time + stats_interval
                 
         except KeyboardInterrupt:
             print("\n[orchestrator] Stopping...")
         except Exception as e:
             print(f"[orchestrator] Error: {e}")
         finally:
-            print("[orchestrator] Stopping workers...")
-            self.stop_workers()
+            # park the workers until the next challenge is set
+            done.set()
 
 # --------------- CLI ---------------
 def parse_args():
@@ -583,7 +684,7 @@ def read_challenges_from_csv(file_path, console):
     import csv
     challenges = []
     try:
-        with open(file_path, newline="", encoding="utf-8") as csvfile:
+        with open(file_path, newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
             # Read the first line to check if it's a header
             first_line = csvfile.readline()
             csvfile.seek(0)  # Reset file pointer to beginning
@@ -687,7 +788,7 @@ def main():
 
     # Register cleanup
     import atexit
-    atexit.register(lambda: error_logger.save_errors_to_file("MULTIADDR"))
+    atexit.register(error_logger.close)
 
     try:
         challenges = read_challenges_from_csv(args.csv_file, console)
@@ -706,54 +807,66 @@ def main():
     print(f"✅ TOTAL challenges: {len(challenges)}")
     print(f"✅ TOTAL addresses: {len(address_list)}")
 
+    # One orchestrator, one set of worker threads and daemon sockets for the whole run
+    orch = Orchestrator(
+        args.base_url,
+        address_list[0],
+        args.daemon_host,
+        args.daemon_port,
+        args.workers,
+        args.submit
+    )
+    orch.start_workers()
+
     # ---------------- Progress Loop ----------------
-    with Progress(
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(),
-        "[progress.percentage]{task.percentage:>3.0f}%",
-        TimeElapsedColumn(),
-        TimeRemainingColumn(),
-        console=console
-    ) as progress:
-
-        challenge_task = progress.add_task("Processing Challenges", total=len(challenges))
-        
-        for c_idx, challenge in enumerate(challenges, start=1):
-            progress.update(challenge_task, description=f"Challenge {c_idx}/{len(challenges)}")
-            # Debug: Print the challenge object to see its structure
-            print(f"\nDebug - challenge object: {challenge}")
-            # Safely get challenge_id or use a default value
-            challenge_id = challenge.get('challenge_id', f'unknown_{c_idx}')
-            console.log(f"\n[bold green]Starting Challenge {c_idx}: {challenge_id}")
-
-            addr_task = progress.add_task("Processing Addresses", total=len(address_list))
-            for a_idx, addr in enumerate(address_list, start=1):
-                progress.update(addr_task, description=f"Addr {a_idx}/{len(address_list)}")
-                stop_event.clear()
-                stats.reset()
-
-                orch = Orchestrator(
-                    args.base_url,
-                    addr,
-                    args.daemon_host,
-                    args.daemon_port,
-                    args.workers,
-                    args.submit
-                )
-                orch.set_challenge(challenge)
-                start_time = time.time()
-                orch.run(stats_interval=10.0)
-                elapsed = time.time() - start_time
-
-                console.log(f"✅ Done mining for address {addr} in {elapsed:.1f}s")
-                progress.advance(addr_task)
-                time.sleep(1)
+    completed = False
+    try:
+        with Progress(
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            "[progress.percentage]{task.percentage:>3.0f}%",
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
+            console=console
+        ) as progress:
+
+            challenge_task = progress.add_task("Processing Challenges", total=len(challenges))
+            
+            for c_idx, challenge in enumerate(challenges, start=1):
+                progress.update(challenge_task, description=f"Challenge {c_idx}/{len(challenges)}")
+                # Debug: Print the challenge object to see its structure
+                print(f"\nDebug - challenge object: {challenge}")
+                # Safely get challenge_id or use a default value
+                challenge_id = challenge.get('challenge_id', f'unknown_{c_idx}')
+                console.log(f"\n[bold green]Starting Challenge {c_idx}: {challenge_id}")
+
+                addr_task = progress.add_task("Processing Addresses", total=len(address_list))
+                for a_idx, addr in enumerate(address_list, start=1):
+                    progress.update(addr_task, description=f"Addr {a_idx}/{len(address_list)}")
+                    stats.reset()
+
+                    start_time = time.time()
+                    orch.run_until_stop(challenge, addr, stats_interval=10.0)
+                    elapsed = time.time() - start_time
+                    if stop_event.is_set():
+                        break
+
+                    console.log(f"✅ Done mining for address {addr} in {elapsed:.1f}s")
+                    progress.advance(addr_task)
+                    time.sleep(1)
 
-            console.log(f"✅ Done Challenge {challenge['challenge_id']}")
-            progress.advance(challenge_task)
-            time.sleep(1)
+                if stop_event.is_set():
+                    break
+                console.log(f"✅ Done Challenge {challenge['challenge_id']}")
+                progress.advance(challenge_task)
+                time.sleep(1)
+        completed = not stop_event.is_set()
+    finally:
+        print("[orchestrator] Stopping workers...")
+        orch.stop_workers()
 
-    console.log("\n✅✅ ALL COMPLETED ✅✅")
+    if completed:
+        console.log("\n✅✅ ALL COMPLETED ✅✅")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
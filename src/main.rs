@@ -34,6 +34,10 @@ fn handle_client(mut stream: TcpStream, mode: Arc<DaemonMode>) {
         eprintln!("Failed clone stream");
         return;
     }
+    // Replies are tiny lines; don't let Nagle hold them back.
+    if let Err(e) = stream.set_nodelay(true) {
+        eprintln!("set_nodelay failed for {:?}: {:?}", peer, e);
+    }
     let mut reader = BufReader::new(stream.try_clone().unwrap());
 
     loop {
@@ -50,7 +54,20 @@ fn handle_client(mut stream: TcpStream, mode: Arc<DaemonMode>) {
                     continue;
                 }
 
-                let hash_hex = match &*mode {
+                // PING lets clients check for SEARCH support before relying on it.
+                let reply = if pre == "PING" {
+                    "PONG".to_string()
+                // SEARCH requests run the nonce loop here and only send back a winner.
+                } else if let Some(req) = pre.strip_prefix("SEARCH|") {
+                    match search_nonces(req, &mode) {
+                        Ok(r) => r,
+                        Err(e) => {
+                            eprintln!("Search failed: {:?}", e);
+                            "err".to_string()
+                        }
+                    }
+                } else {
+                match &*mode {
                     DaemonMode::Demo => {
                         // demo hasher: sha256(pre) + sha512(...) -> hex
                         demo_hash_hex(pre.as_bytes())
@@ -109,9 +126,10 @@ fn handle_client(mut stream: TcpStream, mode: Arc<DaemonMode>) {
                             }
                         }
                     }
+                }
                 };
 
-                if let Err(e) = writeln!(stream, "{}", hash_hex) {
+                if let Err(e) = writeln!(stream, "{}", reply) {
                     eprintln!("Failed write to client {:?}: {:?}", peer, e);
                     break;
                 }
@@ -128,7 +146,106 @@ fn handle_client(mut stream: TcpStream, mode: Arc<DaemonMode>) {
     }
 }
 
+/// Handle a `SEARCH|<rom>|<mask_hex>|<start_nonce_hex>|<count>|<suffix>` request.
+/// Each of `count` consecutive nonces from `start_nonce` is hashed exactly as the
+/// plain line `<rom>|<nonce_hex><suffix>` would be, and the reply is
+/// `FOUND|<nonce_hex>|<hash_hex>` for the first hash whose left 4 bytes satisfy
+/// `(left4 & !mask) == 0`, or `MISS` when none of them does.
+fn search_nonces(req: &str, mode: &DaemonMode) -> Result<String> {
+    let mut parts = req.splitn(5, '|');
+    let mut field = |name: &str| parts.next().ok_or_else(|| anyhow!("SEARCH missing {}", name));
+    let rom = field("rom")?;
+    let mask = u32::from_str_radix(field("mask")?.trim(), 16)?;
+    let start = u64::from_str_radix(field("start nonce")?.trim(), 16)?;
+    let count: u64 = field("count")?.trim().parse()?;
+    let suffix = field("suffix")?;
+
+    // Build the hashed bytes once; only the 16 nonce hex chars change per hash.
+    // Native mode hashes the trimmed preimage alone, the others the whole line.
+    let native = matches!(mode, DaemonMode::Native { .. });
+    let mut buf = Vec::with_capacity(rom.len() + 17 + suffix.len());
+    if !native {
+        buf.extend_from_slice(rom.as_bytes());
+        buf.push(b'|');
+    }
+    let at = buf.len();
+    buf.extend_from_slice(&[b'0'; 16]);
+    buf.extend_from_slice(if native { suffix.trim_end() } else { suffix }.as_bytes());
+
+    let inv_mask = !mask;
+    let hasher = search_hasher(mode, rom.trim());
+    let mut digest = Vec::with_capacity(64);
+    for i in 0..count {
+        write_hex_u64(&mut buf[at..at + 16], start.wrapping_add(i));
+        hasher(&buf, &mut digest)?;
+        if digest.len() < 4 {
+            return Err(anyhow!("hash too short ({} bytes)", digest.len()));
+        }
+        let left4 = u32::from_be_bytes([digest[0], digest[1], digest[2], digest[3]]);
+        if left4 & inv_mask == 0 {
+            let nonce_hex = std::str::from_utf8(&buf[at..at + 16])?;
+            return Ok(format!("FOUND|{}|{}", nonce_hex, hex::encode(&digest)));
+        }
+    }
+    Ok("MISS".to_string())
+}
+
+/// Write `v` as 16 lowercase hex digits into `out` without allocating.
+fn write_hex_u64(out: &mut [u8], v: u64) {
+    const HEX: &[u8; 16] = b"0123456789abcdef";
+    for (i, b) in out.iter_mut().enumerate() {
+        *b = HEX[((v >> (60 - 4 * i)) & 0xf) as usize];
+    }
+}
+
+/// Hash function for a SEARCH loop: hashes the bytes built by `search_nonces`
+/// into a reused digest buffer. Native mode resolves the ROM once up front, so
+/// the nonce loop does not take the shared ROM cache lock for every hash.
+fn search_hasher<'a>(mode: &'a DaemonMode, rom: &'a str) -> Box<dyn Fn(&[u8], &mut Vec<u8>) -> Result<()> + 'a> {
+    match mode {
+        DaemonMode::Demo => Box::new(|line: &[u8], out: &mut Vec<u8>| {
+            demo_hash_into(line, out);
+            Ok(())
+        }),
+        DaemonMode::External { bin } => Box::new(move |line: &[u8], out: &mut Vec<u8>| {
+            let h = call_external_hash(bin, std::str::from_utf8(line)?).map_err(|e| anyhow!("external hash: {}", e))?;
+            *out = hex::decode(h)?;
+            Ok(())
+        }),
+        DaemonMode::Native { .. } => native_search_hasher(rom),
+    }
+}
+
+#[cfg(feature = "native_ashmaize")]
+fn native_search_hasher<'a>(rom: &'a str) -> Box<dyn Fn(&[u8], &mut Vec<u8>) -> Result<()> + 'a> {
+    let rom_arc = native_rom(Some(rom));
+    Box::new(move |pre: &[u8], out: &mut Vec<u8>| {
+        out.clear();
+        out.extend_from_slice(&hash(pre, &rom_arc, 8, 256));
+        Ok(())
+    })
+}
+
+#[cfg(not(feature = "native_ashmaize"))]
+fn native_search_hasher<'a>(rom: &'a str) -> Box<dyn Fn(&[u8], &mut Vec<u8>) -> Result<()> + 'a> {
+    Box::new(move |pre: &[u8], out: &mut Vec<u8>| {
+        *out = native_hash(std::str::from_utf8(pre)?, Some(rom))?;
+        Ok(())
+    })
+}
+
 fn demo_hash_hex(pre: &[u8]) -> String {
+    hex::encode(demo_hash(pre))
+}
+
+fn demo_hash(pre: &[u8]) -> Vec<u8> {
+    let mut out = Vec::with_capacity(64);
+    demo_hash_into(pre, &mut out);
+    out
+}
+
+/// Same as `demo_hash` but writes into `out`, reusing its allocation.
+fn demo_hash_into(pre: &[u8], out: &mut Vec<u8>) {
     use sha2::{Digest, Sha256, Sha512};
     let mut d1 = Sha256::new();
     d1.update(pre);
@@ -137,9 +254,8 @@ fn demo_hash_hex(pre: &[u8]) -> String {
     let mut d2 = Sha512::new();
     d2.update(&d1b);
     d2.update(pre);
-    let out = d2.finalize();
-
-    hex::encode(out)
+    out.clear();
+    out.extend_from_slice(&d2.finalize());
 }
 
 fn call_external_hash(bin: &str, pre: &str) -> Result<String, Box<dyn std::error::Error>> {
@@ -250,50 +366,18 @@ fn main() -> anyhow::Result<()> {
 /// 'rom_init_hex' is optional hex string (no_pre_mine) required by algorithm init.
 /// Return lowercase hex string of hash bytes.
 fn native_hash_hex(pre: &str, rom_init_hex: Option<&str>) -> Result<String> {
+    Ok(hex::encode(native_hash(pre, rom_init_hex)?))
+}
+
+/// Same as `native_hash_hex` but returns the raw hash bytes.
+fn native_hash(pre: &str, rom_init_hex: Option<&str>) -> Result<Vec<u8>> {
     let pre_bytes = pre.as_bytes();
 
     #[cfg(feature = "native_ashmaize")]
     {
-        let key = rom_init_hex.unwrap_or("default").to_string();
-
-        let rom_arc = {
-            let cache = rom_cache();
-            let mut m = cache.lock().unwrap();
-
-            if let Some(r) = m.get(&key) {
-                r.clone()
-            } else {
-                    let seed = if let Some(s) = rom_init_hex {
-            // Scavenger gửi raw bytes → lấy nguyên bytes
-            let bytes = s.as_bytes().to_vec();
-            println!(
-                "[native_hash_hex] Using RAW ROM init ({} bytes)",
-                bytes.len()
-            );
-            bytes
-        } else {
-            b"default_seed".to_vec()
-        };
-
-
-                // init ROM
-                let rom = Rom::new(
-                    &seed,
-                    RomGenerationType::TwoStep {
-                        pre_size: 16 * 1024 * 1024, // 16MB
-                        mixing_numbers: 4,
-                    },
-                    1024 * 1024 * 1024, // 1GB
-                );
-
-                let arc = std::sync::Arc::new(rom);
-                m.insert(key.clone(), arc.clone());
-                arc
-            }
-        };
-
+        let rom_arc = native_rom(rom_init_hex);
         let hash_bytes = hash(pre_bytes, &rom_arc, 8, 256);
-        return Ok(hex::encode(hash_bytes));
+        return Ok(hash_bytes.to_vec());
     }
 
     #[cfg(not(feature = "native_ashmaize"))]
@@ -304,3 +388,41 @@ fn native_hash_hex(pre: &str, rom_init_hex: Option<&str>) -> Result<String> {
     }
 }
 
+/// Look up the cached ROM for `rom_init_hex`, building it on first use.
+#[cfg(feature = "native_ashmaize")]
+fn native_rom(rom_init_hex: Option<&str>) -> std::sync::Arc<Rom> {
+    let key = rom_init_hex.unwrap_or("default").to_string();
+
+    let cache = rom_cache();
+    let mut m = cache.lock().unwrap();
+
+    if let Some(r) = m.get(&key) {
+        return r.clone();
+    }
+
+    let seed = if let Some(s) = rom_init_hex {
+        // Scavenger gửi raw bytes → lấy nguyên bytes
+        let bytes = s.as_bytes().to_vec();
+        println!(
+            "[native_hash_hex] Using RAW ROM init ({} bytes)",
+            bytes.len()
+        );
+        bytes
+    } else {
+        b"default_seed".to_vec()
+    };
+
+    // init ROM
+    let rom = Rom::new(
+        &seed,
+        RomGenerationType::TwoStep {
+            pre_size: 16 * 1024 * 1024, // 16MB
+            mixing_numbers: 4,
+        },
+        1024 * 1024 * 1024, // 1GB
+    );
+
+    let arc = std::sync::Arc::new(rom);
+    m.insert(key, arc.clone());
+    arc
+}